@@ -1,4 +1,4 @@
-from .grover import GroverSearch
-from .qft import QuantumFourierTransform
-from .phase_estimation import PhaseEstimation
+from .grover import GroverSearch
+from .qft import QuantumFourierTransform
+from .phase_estimation import PhaseEstimation
 from .teleportation import Teleportation
\ No newline at end of file
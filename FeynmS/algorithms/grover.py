@@ -1,88 +1,185 @@
-import numpy as np
-from typing import List
-from ..core.circuit import QuantumCircuit
-from ..core.gates import QuantumGate, CustomGate
-
-class GroverSearch:
-    """
-    A class to represent Grover's search algorithm.
-
-    Attributes:
-    num_qubits : int
-        The number of qubits in the quantum circuit.
-    marked_states : List[str]
-        The list of marked states to search for.
-    circuit : QuantumCircuit
-        The quantum circuit used for the algorithm.
-    optimal_iterations : int
-        The optimal number of iterations for the algorithm.
-    """
-    def __init__(self, num_qubits: int, marked_states: List[str]):
-        """
-        Constructs all the necessary attributes for the GroverSearch object.
-
-        Parameters:
-        num_qubits : int
-            The number of qubits in the quantum circuit.
-        marked_states : List[str]
-            The list of marked states to search for.
-        """
-        self.num_qubits = num_qubits
-        self.marked_states = marked_states
-        self.circuit = QuantumCircuit(num_qubits, num_qubits)
-        self.optimal_iterations = int(np.ceil(np.sqrt(2 ** num_qubits / len(marked_states))))
-
-    def _create_oracle(self) -> QuantumGate:
-        """
-        Creates the oracle gate for the marked states.
-
-        Returns:
-        QuantumGate
-            The oracle gate.
-        """
-        N = 2 ** self.num_qubits
-        oracle_matrix = np.eye(N, dtype=complex)
-        for state in self.marked_states:
-            idx = int(state, 2)
-            oracle_matrix[idx, idx] = -1
-        return CustomGate.from_matrix(oracle_matrix, "Oracle")
-
-    def _create_diffusion(self) -> QuantumGate:
-        """
-        Creates the diffusion gate for the algorithm.
-
-        Returns:
-        QuantumGate
-            The diffusion gate.
-        """
-        dim = 2 ** self.num_qubits
-        diffusion_matrix = 2 * np.ones((dim, dim)) / dim - np.eye(dim)
-        return CustomGate.from_matrix(diffusion_matrix, "Diffusion")
-
-    def run(self, measure: bool = True) -> QuantumCircuit:
-        """
-        Runs Grover's search algorithm.
-
-        Parameters:
-        measure : bool, optional
-            Whether to measure the qubits at the end (default is True).
-
-        Returns:
-        QuantumCircuit
-            The quantum circuit after running the algorithm.
-        """
-        for i in range(self.num_qubits):
-            self.circuit.h(i)
-
-        oracle = self._create_oracle()
-        diffusion = self._create_diffusion()
-
-        for _ in range(self.optimal_iterations):
-            self.circuit.add_gate(oracle, list(range(self.num_qubits)))
-            self.circuit.add_gate(diffusion, list(range(self.num_qubits)))
-
-        if measure:
-            for i in range(self.num_qubits):
-                self.circuit.measure(i, i)
-
+import numpy as np
+from typing import List, Optional, Union
+from ..core.circuit import QuantumCircuit
+from ..core.gates import QuantumGate, DiagonalGate, DEFAULT_DTYPE
+from ..core.qubit import MultiQubitState
+
+class DiffusionOp(QuantumGate):
+    """
+    A class to represent the Grover diffusion operator 2|s⟩⟨s| - I.
+
+    The operator is a rank-1 update of the identity, so it is applied
+    matrix-free as `2 * mean(state) - state` in O(2^n) time and O(1)
+    extra memory instead of building the dense 2^n x 2^n matrix. The
+    dense matrix is materialized lazily and only if explicitly requested.
+
+    Attributes:
+    name : str
+        The name of the operator.
+    num_qubits : int
+        The number of qubits the operator acts on.
+    """
+    def __init__(self, num_qubits: int):
+        """
+        Constructs all the necessary attributes for the DiffusionOp object.
+
+        Parameters:
+        num_qubits : int
+            The number of qubits the operator acts on.
+        """
+        self.name = "Diffusion"
+        self.num_qubits = num_qubits
+        self._tensor = None
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The dense matrix representation, built on demand."""
+        if self._matrix is None:
+            dim = 2 ** self.num_qubits
+            self._matrix = 2 * np.ones((dim, dim), dtype=DEFAULT_DTYPE) / dim - np.eye(dim)
+        return self._matrix
+
+    def apply(self, state: Union[np.ndarray, MultiQubitState],
+              qubits: Optional[List[int]] = None) -> Union[np.ndarray, MultiQubitState]:
+        """
+        Applies the diffusion operator without materializing its matrix.
+
+        Parameters:
+        state : Union[np.ndarray, MultiQubitState]
+            The global state vector the operator acts on.
+        qubits : Optional[List[int]], optional
+            Indices of the target qubits within the state. Defaults to the
+            first `num_qubits` qubits.
+
+        Returns:
+        Union[np.ndarray, MultiQubitState]
+            The resulting state after applying the operator.
+        """
+        qubit_names = None
+        if isinstance(state, MultiQubitState):
+            qubit_names = state.qubit_names
+            state_vector = state.state
+        else:
+            state_vector = np.asarray(state)
+
+        num_state_qubits = state_vector.size.bit_length() - 1
+        if qubits is None:
+            qubits = list(range(self.num_qubits))
+        if len(qubits) != self.num_qubits:
+            raise ValueError(f"Gate {self.name} requires {self.num_qubits} qubits")
+
+        if qubits == list(range(num_state_qubits)):
+            # Operador cobre o registro inteiro: reflexão em torno da média.
+            # O kernel opera sobre a view float do buffer complexo — colunas
+            # real/imag intercaladas viram ufuncs float puras (FMA/AVX),
+            # sem despacho de aritmética complexa por elemento.
+            if state_vector.dtype in (np.complex64, np.complex128) and state_vector.flags.c_contiguous:
+                mean = state_vector.mean()
+                new_state = state_vector.copy()
+                float_view = new_state.view(np.float32 if state_vector.dtype == np.complex64 else np.float64)
+                float_view *= -1
+                float_view[0::2] += 2 * mean.real
+                float_view[1::2] += 2 * mean.imag
+            else:
+                new_state = 2 * state_vector.mean() - state_vector
+        else:
+            # Reflexão por bloco: média apenas sobre os eixos alvo
+            state_tensor = np.moveaxis(state_vector.reshape([2] * num_state_qubits),
+                                       qubits, range(self.num_qubits))
+            block = state_tensor.reshape(2 ** self.num_qubits, -1)
+            new_tensor = 2 * block.mean(axis=0, keepdims=True) - block
+            new_tensor = np.moveaxis(new_tensor.reshape([2] * num_state_qubits),
+                                     range(self.num_qubits), qubits)
+            new_state = new_tensor.reshape(-1)
+
+        if qubit_names is not None:
+            return MultiQubitState(new_state, qubit_names)
+        return new_state
+
+class GroverSearch:
+    """
+    A class to represent Grover's search algorithm.
+
+    Attributes:
+    num_qubits : int
+        The number of qubits in the quantum circuit.
+    marked_states : List[str]
+        The list of marked states to search for.
+    circuit : QuantumCircuit
+        The quantum circuit used for the algorithm.
+    optimal_iterations : int
+        The optimal number of iterations for the algorithm.
+    """
+    def __init__(self, num_qubits: int, marked_states: List[str]):
+        """
+        Constructs all the necessary attributes for the GroverSearch object.
+
+        Parameters:
+        num_qubits : int
+            The number of qubits in the quantum circuit.
+        marked_states : List[str]
+            The list of marked states to search for.
+        """
+        self.num_qubits = num_qubits
+        self.marked_states = marked_states
+        self.circuit = QuantumCircuit(num_qubits, num_qubits)
+        self.optimal_iterations = int(np.ceil(np.sqrt(2 ** num_qubits / len(marked_states))))
+
+    def _create_oracle(self) -> QuantumGate:
+        """
+        Creates the oracle gate for the marked states.
+
+        Returns:
+        QuantumGate
+            The oracle gate.
+        """
+        N = 2 ** self.num_qubits
+        # Guarda só a diagonal (O(2^n)) em vez da matriz densa N x N (O(4^n));
+        # índices marcados convertidos de uma vez e aplicados por fancy indexing
+        diag = np.ones(N, dtype=DEFAULT_DTYPE)
+        marked_indices = np.fromiter((int(state, 2) for state in self.marked_states),
+                                     dtype=np.int64, count=len(self.marked_states))
+        diag[marked_indices] = -1
+        return DiagonalGate(diag, "Oracle")
+
+    def _create_diffusion(self) -> QuantumGate:
+        """
+        Creates the diffusion gate for the algorithm.
+
+        Returns:
+        QuantumGate
+            The diffusion gate.
+        """
+        # Operador matrix-free: aplica 2*mean(state) - state em O(2^n)
+        return DiffusionOp(self.num_qubits)
+
+    def run(self, measure: bool = True) -> QuantumCircuit:
+        """
+        Runs Grover's search algorithm.
+
+        Parameters:
+        measure : bool, optional
+            Whether to measure the qubits at the end (default is True).
+
+        Returns:
+        QuantumCircuit
+            The quantum circuit after running the algorithm.
+        """
+        # |+⟩^⊗n é 1/√N · ones(N): escreve as amplitudes diretamente em vez
+        # de n passadas de Hadamard sobre o vetor de estado
+        N = 2 ** self.num_qubits
+        self.circuit.set_state(np.full(N, 1 / np.sqrt(N), dtype=self.circuit.dtype))
+
+        oracle = self._create_oracle()
+        diffusion = self._create_diffusion()
+
+        for _ in range(self.optimal_iterations):
+            self.circuit.add_gate(oracle, list(range(self.num_qubits)))
+            self.circuit.add_gate(diffusion, list(range(self.num_qubits)))
+
+        if measure:
+            for i in range(self.num_qubits):
+                self.circuit.measure(i, i)
+
         return self.circuit
\ No newline at end of file
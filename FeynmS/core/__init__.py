@@ -1,3 +1,3 @@
-from .qubit import Qubit
-from .gates import QuantumGate, StandardGates, ControlledGate
+from .qubit import Qubit
+from .gates import QuantumGate, StandardGates, ControlledGate
 from .circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
\ No newline at end of file
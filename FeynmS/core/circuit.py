@@ -1,395 +1,568 @@
-import numpy as np
-from typing import List, Dict, Optional, Union, Tuple
-from .qubit import Qubit, MultiQubitState
-from .gates import QuantumGate, StandardGates, ControlledGate
-import copy
-
-class QuantumRegister:
-    """
-    A class to represent a quantum register.
-
-    Attributes:
-    size : int
-        The number of qubits in the register.
-    name : str
-        The name of the register.
-    qubits : List[Qubit]
-        The list of qubits in the register.
-    """
-    def __init__(self, size: int, name: str = "q"):
-        """
-        Constructs all the necessary attributes for the QuantumRegister object.
-
-        Parameters:
-        size : int
-            The number of qubits in the register.
-        name : str, optional
-            The name of the register (default is "q").
-        """
-        self.size = size
-        self.name = name
-        self.qubits = [Qubit(name=f"{name}_{i}") for i in range(size)]
-
-    def __getitem__(self, index: int) -> Qubit:
-        """
-        Gets the qubit at the specified index.
-
-        Parameters:
-        index : int
-            The index of the qubit.
-
-        Returns:
-        Qubit
-            The qubit at the specified index.
-        """
-        return self.qubits[index]
-
-    def __setitem__(self, index: int, value: Qubit):
-        """
-        Sets the qubit at the specified index.
-
-        Parameters:
-        index : int
-            The index of the qubit.
-        value : Qubit
-            The qubit to set at the specified index.
-        """
-        self.qubits[index] = value
-
-    def __len__(self) -> int:
-        """
-        Returns the number of qubits in the register.
-
-        Returns:
-        int
-            The number of qubits in the register.
-        """
-        return self.size
-
-class ClassicalRegister:
-    """
-    A class to represent a classical register.
-
-    Attributes:
-    size : int
-        The number of bits in the register.
-    name : str
-        The name of the register.
-    bits : List[int]
-        The list of bits in the register.
-    """
-    def __init__(self, size: int, name: str = "c"):
-        """
-        Constructs all the necessary attributes for the ClassicalRegister object.
-
-        Parameters:
-        size : int
-            The number of bits in the register.
-        name : str, optional
-            The name of the register (default is "c").
-        """
-        self.size = size
-        self.name = name
-        self.bits = [0] * size
-
-    def __getitem__(self, index: int) -> int:
-        """
-        Gets the bit at the specified index.
-
-        Parameters:
-        index : int
-            The index of the bit.
-
-        Returns:
-        int
-            The bit at the specified index.
-        """
-        return self.bits[index]
-
-    def __setitem__(self, index: int, value: int):
-        """
-        Sets the bit at the specified index.
-
-        Parameters:
-        index : int
-            The index of the bit.
-        value : int
-            The bit to set at the specified index.
-        """
-        if value not in [0, 1]:
-            raise ValueError("Classical bit must be 0 or 1")
-        self.bits[index] = value
-
-    def __len__(self) -> int:
-        """
-        Returns the number of bits in the register.
-
-        Returns:
-        int
-            The number of bits in the register.
-        """
-        return self.size
-
-class Operation:
-    """
-    A class to represent a quantum operation.
-
-    Attributes:
-    gate : QuantumGate
-        The quantum gate to be applied.
-    qubits : List[int]
-        The list of qubits the gate acts on.
-    classical_bits : Optional[List[int]]
-        The list of classical bits involved in the operation.
-    """
-    def __init__(self, gate: QuantumGate, qubits: List[int], classical_bits: Optional[List[int]] = None):
-        """
-        Constructs all the necessary attributes for the Operation object.
-
-        Parameters:
-        gate : QuantumGate
-            The quantum gate to be applied.
-        qubits : List[int]
-            The list of qubits the gate acts on.
-        classical_bits : Optional[List[int]], optional
-            The list of classical bits involved in the operation (default is None).
-        """
-        self.gate = gate
-        self.qubits = qubits
-        self.classical_bits = classical_bits or []
-
-class QuantumCircuit:
-    """
-    A class to represent a quantum circuit.
-
-    Attributes:
-    qreg : QuantumRegister
-        The quantum register of the circuit.
-    creg : ClassicalRegister
-        The classical register of the circuit.
-    operations : List[Operation]
-        The list of operations in the circuit.
-    _standard_gates : StandardGates
-        The standard quantum gates.
-    """
-    def __init__(self, quantum_register: Union[QuantumRegister, int], classical_register: Optional[Union[ClassicalRegister, int]] = None):
-        """
-        Constructs all the necessary attributes for the QuantumCircuit object.
-
-        Parameters:
-        quantum_register : Union[QuantumRegister, int]
-            The quantum register or its size.
-        classical_register : Optional[Union[ClassicalRegister, int]], optional
-            The classical register or its size (default is None).
-        """
-        if isinstance(quantum_register, int):
-            self.qreg = QuantumRegister(quantum_register)
-        else:
-            self.qreg = quantum_register
-
-        if classical_register is None:
-            self.creg = ClassicalRegister(self.qreg.size)
-        elif isinstance(classical_register, int):
-            self.creg = ClassicalRegister(classical_register)
-        else:
-            self.creg = classical_register
-
-        self.operations: List[Operation] = []
-        self._standard_gates = StandardGates()
-
-    @property
-    def num_qubits(self) -> int:
-        """
-        Returns the number of qubits in the quantum register.
-
-        Returns:
-        int
-            The number of qubits in the quantum register.
-        """
-        return self.qreg.size
-
-    @property
-    def num_clbits(self) -> int:
-        """
-        Returns the number of bits in the classical register.
-
-        Returns:
-        int
-            The number of bits in the classical register.
-        """
-        return self.creg.size
-
-    def add_gate(self, gate: Union[QuantumGate, str], qubits: Union[int, List[int]], classical_bits: Optional[Union[int, List[int]]] = None):
-        """
-        Adds a gate to the circuit.
-
-        Parameters:
-        gate : Union[QuantumGate, str]
-            The quantum gate or its name.
-        qubits : Union[int, List[int]]
-            The qubit or list of qubits the gate acts on.
-        classical_bits : Optional[Union[int, List[int]]], optional
-            The classical bit or list of bits involved in the operation (default is None).
-        """
-        if isinstance(qubits, int):
-            qubits = [qubits]
-        if isinstance(classical_bits, int):
-            classical_bits = [classical_bits]
-
-        if isinstance(gate, str):
-            gate = getattr(StandardGates, gate.upper())()
-
-        if len(qubits) != gate.num_qubits:
-            raise ValueError(f"Gate {gate.name} must have {gate.num_qubits} qubits")
-
-        self.operations.append(Operation(gate, qubits, classical_bits))
-
-    def h(self, qubit: int):
-        """
-        Adds a Hadamard gate to the circuit.
-
-        Parameters:
-        qubit : int
-            The qubit the gate acts on.
-        """
-        self.add_gate(StandardGates.H(), qubit)
-
-    def x(self, qubit: int):
-        """
-        Adds a Pauli-X gate to the circuit.
-
-        Parameters:
-        qubit : int
-            The qubit the gate acts on.
-        """
-        self.add_gate(StandardGates.X(), qubit)
-
-    def cx(self, control: int, target: int):
-        """
-        Adds a controlled-NOT gate to the circuit.
-
-        Parameters:
-        control : int
-            The control qubit.
-        target : int
-            The target qubit.
-        """
-        self.add_gate(ControlledGate.CNOT(), [control, target])
-
-    def measure(self, qubit: int, cbit: int):
-        """
-        Adds a measurement operation to the circuit.
-
-        Parameters:
-        qubit : int
-            The qubit to be measured.
-        cbit : int
-            The classical bit to store the measurement result.
-        """
-        measure_gate = QuantumGate(np.eye(2), "Measure", num_qubits=1)
-        self.add_gate(measure_gate, qubit, cbit)
-
-    def execute(self, shots: int = 1) -> Dict[str, int]:
-        """
-        Executes the quantum circuit.
-
-        Parameters:
-        shots : int, optional
-            The number of times to run the circuit (default is 1).
-
-        Returns:
-        Dict[str, int]
-            The measurement results.
-        """
-        results = {}
-        for _ in range(shots):
-            # Estado inicial |00...0⟩
-            global_state = np.zeros(2**self.num_qubits, dtype=complex)
-            global_state[0] = 1.0
-            measured_bits = [0] * self.creg.size
-
-            for op in self.operations:
-                if op.gate is None:  # Medição
-                    qubit_idx = op.qubits[0]
-                    cbit_idx = op.classical_bits[0]
-                    prob_0 = sum(np.abs(global_state[i])**2 
-                                 for i in range(2**self.num_qubits) 
-                                 if not (i & (1 << (self.num_qubits - 1 - qubit_idx))))
-                    prob_1 = 1 - prob_0
-                    result = 1 if np.random.random() < prob_1 else 0
-                    measured_bits[cbit_idx] = result
-                    global_state = self._collapse_state(global_state, qubit_idx, result)
-                else:
-                    # Aplicação da porta
-                    gate_matrix = self._expand_gate(op.gate, op.qubits)
-                    global_state = gate_matrix @ global_state
-                    global_state /= np.linalg.norm(global_state)
-
-            result_str = ''.join(map(str, measured_bits))
-            results[result_str] = results.get(result_str, 0) + 1
-        return results
-    
-    def _expand_gate(self, gate: QuantumGate, qubit_indices: List[int]) -> np.ndarray:
-        if gate.num_qubits == 1:
-            matrix = gate.matrix
-            for i in range(self.num_qubits):
-                if i not in qubit_indices:
-                    matrix = np.kron(matrix, np.eye(2))
-            return matrix
-        elif gate.num_qubits == 2:
-            # Simplificação: assume qubits consecutivos
-            return np.kron(np.eye(2**(self.num_qubits - 2)), gate.matrix)
-        else:
-            raise NotImplementedError("Gates with more than 2 qubits not yet supported")
-
-    def _collapse_state(self, state: np.ndarray, qubit_idx: int, result: int) -> np.ndarray:
-        new_state = state.copy()
-        for i in range(len(state)):
-            if ((i >> (self.num_qubits - 1 - qubit_idx)) & 1) != result:
-                new_state[i] = 0
-        norm = np.linalg.norm(new_state)
-        if norm > 0:
-            new_state /= norm
-        return new_state
-
-    def draw(self) -> str:
-        """
-        Draws the quantum circuit.
-
-        Returns:
-        str
-            The string representation of the circuit.
-        """
-        circuit_str = ["Quantum Circuit:", "-" * 50]
-        qubit_lines = {i: [] for i in range(self.num_qubits)}
-        for op in self.operations:
-            gate = op.gate.name
-            for qubit in op.qubits:
-                if gate == "H":
-                    qubit_lines[qubit].append("H")
-                elif gate == "X":
-                    qubit_lines[qubit].append("X")
-                elif gate == "CNOT":
-                    if qubit == op.qubits[0]:
-                        qubit_lines[qubit].append("C")
-                    elif qubit == op.qubits[1]:
-                        qubit_lines[qubit].append("X")
-                elif gate == "Y":
-                    qubit_lines[qubit].append("Y")
-                elif gate == "Z":
-                    qubit_lines[qubit].append("Z")
-        for i in range(self.num_qubits):
-            line = f"q_{i}: " + " ".join(qubit_lines[i])
-            circuit_str.append(line)
-        circuit_str.append("-" * 50)
-        return "\n".join(circuit_str)
-
-    def __str__(self):
-        """
-        Returns a string representation of the quantum circuit.
-
-        Returns:
-        str
-            The string representation of the quantum circuit.
-        """
+import numpy as np
+from typing import List, Dict, Optional, Union, Tuple
+from .qubit import Qubit, MultiQubitState
+from .gates import QuantumGate, StandardGates, ControlledGate, DEFAULT_DTYPE
+from ..utils.state_utils import measure_state
+import copy
+
+class QuantumRegister:
+    """
+    A class to represent a quantum register.
+
+    Attributes:
+    size : int
+        The number of qubits in the register.
+    name : str
+        The name of the register.
+    qubits : List[Qubit]
+        The list of qubits in the register.
+    """
+    def __init__(self, size: int, name: str = "q"):
+        """
+        Constructs all the necessary attributes for the QuantumRegister object.
+
+        Parameters:
+        size : int
+            The number of qubits in the register.
+        name : str, optional
+            The name of the register (default is "q").
+        """
+        self.size = size
+        self.name = name
+        self.qubits = [Qubit(name=f"{name}_{i}") for i in range(size)]
+
+    def __getitem__(self, index: int) -> Qubit:
+        """
+        Gets the qubit at the specified index.
+
+        Parameters:
+        index : int
+            The index of the qubit.
+
+        Returns:
+        Qubit
+            The qubit at the specified index.
+        """
+        return self.qubits[index]
+
+    def __setitem__(self, index: int, value: Qubit):
+        """
+        Sets the qubit at the specified index.
+
+        Parameters:
+        index : int
+            The index of the qubit.
+        value : Qubit
+            The qubit to set at the specified index.
+        """
+        self.qubits[index] = value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of qubits in the register.
+
+        Returns:
+        int
+            The number of qubits in the register.
+        """
+        return self.size
+
+class ClassicalRegister:
+    """
+    A class to represent a classical register.
+
+    Attributes:
+    size : int
+        The number of bits in the register.
+    name : str
+        The name of the register.
+    bits : List[int]
+        The list of bits in the register.
+    """
+    def __init__(self, size: int, name: str = "c"):
+        """
+        Constructs all the necessary attributes for the ClassicalRegister object.
+
+        Parameters:
+        size : int
+            The number of bits in the register.
+        name : str, optional
+            The name of the register (default is "c").
+        """
+        self.size = size
+        self.name = name
+        self.bits = [0] * size
+
+    def __getitem__(self, index: int) -> int:
+        """
+        Gets the bit at the specified index.
+
+        Parameters:
+        index : int
+            The index of the bit.
+
+        Returns:
+        int
+            The bit at the specified index.
+        """
+        return self.bits[index]
+
+    def __setitem__(self, index: int, value: int):
+        """
+        Sets the bit at the specified index.
+
+        Parameters:
+        index : int
+            The index of the bit.
+        value : int
+            The bit to set at the specified index.
+        """
+        if value not in [0, 1]:
+            raise ValueError("Classical bit must be 0 or 1")
+        self.bits[index] = value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of bits in the register.
+
+        Returns:
+        int
+            The number of bits in the register.
+        """
+        return self.size
+
+class Operation:
+    """
+    A class to represent a quantum operation.
+
+    Attributes:
+    gate : QuantumGate
+        The quantum gate to be applied.
+    qubits : List[int]
+        The list of qubits the gate acts on.
+    classical_bits : Optional[List[int]]
+        The list of classical bits involved in the operation.
+    """
+    def __init__(self, gate: QuantumGate, qubits: List[int], classical_bits: Optional[List[int]] = None):
+        """
+        Constructs all the necessary attributes for the Operation object.
+
+        Parameters:
+        gate : QuantumGate
+            The quantum gate to be applied.
+        qubits : List[int]
+            The list of qubits the gate acts on.
+        classical_bits : Optional[List[int]], optional
+            The list of classical bits involved in the operation (default is None).
+        """
+        self.gate = gate
+        self.qubits = qubits
+        self.classical_bits = classical_bits or []
+
+class QuantumCircuit:
+    """
+    A class to represent a quantum circuit.
+
+    Attributes:
+    qreg : QuantumRegister
+        The quantum register of the circuit.
+    creg : ClassicalRegister
+        The classical register of the circuit.
+    operations : List[Operation]
+        The list of operations in the circuit.
+    _standard_gates : StandardGates
+        The standard quantum gates.
+    """
+    def __init__(self, quantum_register: Union[QuantumRegister, int], classical_register: Optional[Union[ClassicalRegister, int]] = None,
+                 dtype: Optional[np.dtype] = None):
+        """
+        Constructs all the necessary attributes for the QuantumCircuit object.
+
+        Parameters:
+        quantum_register : Union[QuantumRegister, int]
+            The quantum register or its size.
+        classical_register : Optional[Union[ClassicalRegister, int]], optional
+            The classical register or its size (default is None).
+        dtype : Optional[np.dtype], optional
+            The complex dtype of the simulated state vector. Defaults to
+            DEFAULT_DTYPE, overridable globally via the FEYNMS_DTYPE
+            environment variable; complex64 halves the state's memory
+            footprint. Gates built at a higher precision promote each
+            contraction result transiently; the execution loop casts the
+            state back to this dtype after every gate.
+        """
+        self.dtype = np.dtype(dtype) if dtype is not None else DEFAULT_DTYPE
+        if isinstance(quantum_register, int):
+            self.qreg = QuantumRegister(quantum_register)
+        else:
+            self.qreg = quantum_register
+
+        if classical_register is None:
+            self.creg = ClassicalRegister(self.qreg.size)
+        elif isinstance(classical_register, int):
+            self.creg = ClassicalRegister(classical_register)
+        else:
+            self.creg = classical_register
+
+        # Layout SoA: listas paralelas em vez de uma lista de Operation,
+        # permitindo cópia em bloco e varredura por índice no agendamento
+        self._op_gates: List[QuantumGate] = []
+        self._op_qubits: List[List[int]] = []
+        self._op_clbits: List[List[int]] = []
+        self._initial_state: Optional[np.ndarray] = None
+        self._standard_gates = StandardGates()
+
+    @property
+    def num_qubits(self) -> int:
+        """
+        Returns the number of qubits in the quantum register.
+
+        Returns:
+        int
+            The number of qubits in the quantum register.
+        """
+        return self.qreg.size
+
+    @property
+    def num_clbits(self) -> int:
+        """
+        Returns the number of bits in the classical register.
+
+        Returns:
+        int
+            The number of bits in the classical register.
+        """
+        return self.creg.size
+
+    def add_gate(self, gate: Union[QuantumGate, str], qubits: Union[int, List[int]], classical_bits: Optional[Union[int, List[int]]] = None):
+        """
+        Adds a gate to the circuit.
+
+        Parameters:
+        gate : Union[QuantumGate, str]
+            The quantum gate or its name.
+        qubits : Union[int, List[int]]
+            The qubit or list of qubits the gate acts on.
+        classical_bits : Optional[Union[int, List[int]]], optional
+            The classical bit or list of bits involved in the operation (default is None).
+        """
+        if isinstance(qubits, int):
+            qubits = [qubits]
+        if isinstance(classical_bits, int):
+            classical_bits = [classical_bits]
+
+        if isinstance(gate, str):
+            gate = getattr(StandardGates, gate.upper())()
+
+        if len(qubits) != gate.num_qubits:
+            raise ValueError(f"Gate {gate.name} must have {gate.num_qubits} qubits")
+
+        self._op_gates.append(gate)
+        self._op_qubits.append(qubits)
+        self._op_clbits.append(classical_bits or [])
+
+    def set_state(self, state: np.ndarray):
+        """
+        Sets the initial state vector of the circuit directly.
+
+        States with a known closed form (e.g. the uniform superposition)
+        can be written in one allocation instead of being prepared with a
+        ladder of gates, each of which costs a full statevector pass.
+
+        Parameters:
+        state : np.ndarray
+            The initial state vector, of length 2^num_qubits and
+            normalized.
+        """
+        state = np.asarray(state, dtype=self.dtype).reshape(-1)
+        if state.size != 2 ** self.num_qubits:
+            raise ValueError(f"Initial state must have length {2 ** self.num_qubits}")
+        if not np.isclose(np.sum(np.abs(state) ** 2), 1, rtol=1e-5):
+            raise ValueError("Initial state must be normalized")
+        self._initial_state = state
+
+    def optimize(self) -> 'QuantumCircuit':
+        """
+        Fuses consecutive single-qubit gates acting on the same qubit.
+
+        Whenever two single-qubit gates hit the same qubit with no other
+        operation touching that qubit in between, they are pre-multiplied
+        into one 2x2 gate at build time. Long Hadamard/rotation chains
+        then cost a single statevector pass instead of one per gate.
+
+        Returns:
+        QuantumCircuit
+            The circuit itself, with the fused operation list.
+        """
+        new_gates: List[QuantumGate] = []
+        new_qubits: List[List[int]] = []
+        new_clbits: List[List[int]] = []
+        # qubit -> índice em new_gates da última porta 1-qubit ainda fundível
+        pending: Dict[int, int] = {}
+
+        for gate, qubits, clbits in zip(self._op_gates, self._op_qubits, self._op_clbits):
+            if gate.num_qubits == 1 and gate.name != "Measure":
+                qubit = qubits[0]
+                if qubit in pending:
+                    # Funde na porta anterior: produto de duas matrizes 2x2
+                    prev_idx = pending[qubit]
+                    prev = new_gates[prev_idx]
+                    fused = QuantumGate.from_trusted(gate.matrix @ prev.matrix,
+                                                     f"{gate.name}*{prev.name}")
+                    new_gates[prev_idx] = fused
+                    continue
+                pending[qubit] = len(new_gates)
+            else:
+                # Operação multi-qubit ou medição bloqueia fusão nesses qubits
+                for qubit in qubits:
+                    pending.pop(qubit, None)
+
+            new_gates.append(gate)
+            new_qubits.append(qubits)
+            new_clbits.append(clbits)
+
+        self._op_gates = new_gates
+        self._op_qubits = new_qubits
+        self._op_clbits = new_clbits
+        return self
+
+    def extend(self, other: 'QuantumCircuit'):
+        """
+        Appends all operations of another circuit to this one.
+
+        Thanks to the parallel-array layout this is three bulk list
+        extends instead of a per-operation add_gate loop.
+
+        Parameters:
+        other : QuantumCircuit
+            The circuit whose operations are appended. Its qubit indices
+            must be valid in this circuit.
+        """
+        self._op_gates.extend(other._op_gates)
+        self._op_qubits.extend(other._op_qubits)
+        self._op_clbits.extend(other._op_clbits)
+
+    @property
+    def operations(self) -> List[Operation]:
+        """
+        Returns the operations as a list of Operation objects.
+
+        The circuit stores operations as parallel arrays (gates, qubit
+        indices, classical bits); this view is rebuilt on access for
+        compatibility with code that iterates Operation objects.
+        """
+        return [Operation(gate, qubits, clbits or None)
+                for gate, qubits, clbits in zip(self._op_gates, self._op_qubits, self._op_clbits)]
+
+    def h(self, qubit: int):
+        """
+        Adds a Hadamard gate to the circuit.
+
+        Parameters:
+        qubit : int
+            The qubit the gate acts on.
+        """
+        self.add_gate(StandardGates.H(), qubit)
+
+    def x(self, qubit: int):
+        """
+        Adds a Pauli-X gate to the circuit.
+
+        Parameters:
+        qubit : int
+            The qubit the gate acts on.
+        """
+        self.add_gate(StandardGates.X(), qubit)
+
+    def cx(self, control: int, target: int):
+        """
+        Adds a controlled-NOT gate to the circuit.
+
+        Parameters:
+        control : int
+            The control qubit.
+        target : int
+            The target qubit.
+        """
+        self.add_gate(ControlledGate.CNOT(), [control, target])
+
+    def measure(self, qubit: int, cbit: int):
+        """
+        Adds a measurement operation to the circuit.
+
+        Parameters:
+        qubit : int
+            The qubit to be measured.
+        cbit : int
+            The classical bit to store the measurement result.
+        """
+        measure_gate = QuantumGate(np.eye(2), "Measure", num_qubits=1)
+        self.add_gate(measure_gate, qubit, cbit)
+
+    def execute(self, shots: int = 1) -> Dict[str, int]:
+        """
+        Executes the quantum circuit.
+
+        Parameters:
+        shots : int, optional
+            The number of times to run the circuit (default is 1).
+
+        Returns:
+        Dict[str, int]
+            The measurement results.
+        """
+        return self.run(shots)
+
+    def run(self, shots: int = 1024) -> Dict[str, int]:
+        """
+        Runs the circuit by evolving the state vector once and sampling
+        all shots from the final probability distribution.
+
+        When every measurement comes after the last gate (the common case
+        for the bundled algorithms), the circuit is simulated a single
+        time, the measured qubits are marginalized out of |ψ|² and the
+        shots are drawn in one batched sampling call — instead of
+        re-simulating the whole circuit once per shot. Circuits with
+        mid-circuit measurements fall back to per-shot collapse.
+
+        Parameters:
+        shots : int, optional
+            The number of measurement shots (default is 1024).
+
+        Returns:
+        Dict[str, int]
+            The measurement results, keyed by classical register bitstring.
+        """
+        gate_names = [gate.name for gate in self._op_gates]
+        measure_indices = [i for i, name in enumerate(gate_names) if name == "Measure"]
+
+        # Medição no meio do circuito exige colapso por shot
+        if measure_indices:
+            first_measure = measure_indices[0]
+            if any(name != "Measure" for name in gate_names[first_measure + 1:]):
+                return self._run_with_collapse(shots)
+
+        # Estado inicial (|00...0⟩ ou o definido via set_state), evoluído uma única vez
+        if self._initial_state is not None:
+            global_state = self._initial_state.copy()
+        else:
+            global_state = np.zeros(2**self.num_qubits, dtype=self.dtype)
+            global_state[0] = 1.0
+        for i, gate in enumerate(self._op_gates):
+            if gate.name != "Measure":
+                global_state = gate.apply(global_state, self._op_qubits[i])
+                if global_state.dtype != self.dtype:
+                    # Portas em precisão maior promovem o resultado da
+                    # contração; volta ao dtype do circuito para manter o
+                    # footprint prometido
+                    global_state = global_state.astype(self.dtype)
+
+        if not measure_indices:
+            return {'0' * self.creg.size: shots}
+
+        # Marginaliza |ψ|² sobre os qubits não medidos
+        measured = [(self._op_qubits[i][0], self._op_clbits[i][0]) for i in measure_indices]
+        measured_qubits = sorted(q for q, _ in measured)
+        qubit_to_cbit = dict(measured)
+        probabilities = np.abs(global_state) ** 2
+        unmeasured = tuple(i for i in range(self.num_qubits) if i not in qubit_to_cbit)
+        marginal = probabilities.reshape([2] * self.num_qubits)
+        if unmeasured:
+            marginal = marginal.sum(axis=unmeasured)
+        marginal = marginal.reshape(-1)
+
+        # Amostra todos os shots de uma vez via measure_state
+        outcome_counts = measure_state(np.sqrt(marginal), shots)
+
+        results = {}
+        for outcome, count in outcome_counts.items():
+            bits = ['0'] * self.creg.size
+            for bit, qubit in zip(outcome, measured_qubits):
+                bits[qubit_to_cbit[qubit]] = bit
+            results[''.join(bits)] = count
+        return results
+
+    def _run_with_collapse(self, shots: int) -> Dict[str, int]:
+        """Per-shot execution with state collapse after each measurement."""
+        results = {}
+        for _ in range(shots):
+            # Estado inicial (|00...0⟩ ou o definido via set_state)
+            if self._initial_state is not None:
+                global_state = self._initial_state.copy()
+            else:
+                global_state = np.zeros(2**self.num_qubits, dtype=self.dtype)
+                global_state[0] = 1.0
+            measured_bits = [0] * self.creg.size
+
+            for i, gate in enumerate(self._op_gates):
+                if gate.name == "Measure":
+                    qubit_idx = self._op_qubits[i][0]
+                    cbit_idx = self._op_clbits[i][0]
+                    prob_0 = sum(np.abs(global_state[i])**2
+                                 for i in range(2**self.num_qubits)
+                                 if not (i & (1 << (self.num_qubits - 1 - qubit_idx))))
+                    prob_1 = 1 - prob_0
+                    result = 1 if np.random.random() < prob_1 else 0
+                    measured_bits[cbit_idx] = result
+                    global_state = self._collapse_state(global_state, qubit_idx, result)
+                else:
+                    # Aplicação da porta por contração tensorial nos qubits alvo
+                    global_state = gate.apply(global_state, self._op_qubits[i])
+                    if global_state.dtype != self.dtype:
+                        global_state = global_state.astype(self.dtype)
+
+            result_str = ''.join(map(str, measured_bits))
+            results[result_str] = results.get(result_str, 0) + 1
+        return results
+    
+    def _collapse_state(self, state: np.ndarray, qubit_idx: int, result: int) -> np.ndarray:
+        new_state = state.copy()
+        for i in range(len(state)):
+            if ((i >> (self.num_qubits - 1 - qubit_idx)) & 1) != result:
+                new_state[i] = 0
+        norm = np.linalg.norm(new_state)
+        if norm > 0:
+            new_state /= norm
+        return new_state
+
+    def draw(self) -> str:
+        """
+        Draws the quantum circuit.
+
+        Returns:
+        str
+            The string representation of the circuit.
+        """
+        circuit_str = ["Quantum Circuit:", "-" * 50]
+        qubit_lines = {i: [] for i in range(self.num_qubits)}
+        for op in self.operations:
+            gate = op.gate.name
+            for qubit in op.qubits:
+                if gate == "H":
+                    qubit_lines[qubit].append("H")
+                elif gate == "X":
+                    qubit_lines[qubit].append("X")
+                elif gate == "CNOT":
+                    if qubit == op.qubits[0]:
+                        qubit_lines[qubit].append("C")
+                    elif qubit == op.qubits[1]:
+                        qubit_lines[qubit].append("X")
+                elif gate == "Y":
+                    qubit_lines[qubit].append("Y")
+                elif gate == "Z":
+                    qubit_lines[qubit].append("Z")
+        for i in range(self.num_qubits):
+            line = f"q_{i}: " + " ".join(qubit_lines[i])
+            circuit_str.append(line)
+        circuit_str.append("-" * 50)
+        return "\n".join(circuit_str)
+
+    def __str__(self):
+        """
+        Returns a string representation of the quantum circuit.
+
+        Returns:
+        str
+            The string representation of the quantum circuit.
+        """
         return f"QuantumCircuit({self.num_qubits} qubits, {self.num_clbits} bits)"
\ No newline at end of file
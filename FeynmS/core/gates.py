@@ -1,178 +1,472 @@
-import numpy as np
-from typing import List, Optional, Union, Tuple
-from .qubit import Qubit, MultiQubitState
-
-class QuantumGate:
-    """
-    A class to represent a quantum gate.
-
-    Attributes:
-    matrix : np.ndarray
-        The matrix representation of the quantum gate.
-    name : str
-        The name of the quantum gate.
-    num_qubits : int
-        The number of qubits the gate acts on.
-    """
-    def __init__(self, matrix: np.ndarray, name: str, num_qubits: int = 1):
-        """
-        Constructs all the necessary attributes for the QuantumGate object.
-
-        Parameters:
-        matrix : np.ndarray
-            The matrix representation of the quantum gate.
-        name : str
-            The name of the quantum gate.
-        num_qubits : int, optional
-            The number of qubits the gate acts on (default is 1).
-        """
-        self.matrix = np.array(matrix, dtype=complex)
-        self.name = name
-        self.num_qubits = num_qubits
-        self._validate_matrix()
-
-    def _validate_matrix(self):
-        dim = 2 ** self.num_qubits
-        if self.matrix.shape != (dim, dim):
-            raise ValueError(f"Matrix must have dimension {dim}x{dim}")
-        if not np.allclose(self.matrix @ self.matrix.conj().T, np.eye(dim)):
-            raise ValueError("Matrix must be unitary")
-
-    def apply(self, qubits: List[Qubit]) -> 'MultiQubitState':
-        """
-        Applies the quantum gate to a qubit or a list of qubits.
-
-        Parameters:
-        qubit : Union[Qubit, List[Qubit]]
-            The qubit or list of qubits to apply the gate to.
-
-        Returns:
-        Union[Qubit, MultiQubitState]
-            The resulting qubit or multi-qubit state after applying the gate.
-        """
-        if len(qubits) != self.num_qubits:
-            raise ValueError(f"Gate {self.name} requires {self.num_qubits} qubits")
-        
-        # Constrói o estado global com produto tensorial
-        global_state = qubits[0].state
-        for q in qubits[1:]:
-            global_state = np.kron(global_state, q.state)
-        
-        # Aplica a matriz da porta ao estado global
-        new_state = np.dot(self.matrix, global_state)
-        
-        # Normaliza o estado resultante
-        norm = np.linalg.norm(new_state)
-        if norm > 0:
-            new_state /= norm
-        
-        # Retorna um MultiQubitState com o novo estado
-        return MultiQubitState(new_state, [q.name for q in qubits])
-
-    def __str__(self):
-        """
-        Returns a string representation of the quantum gate.
-
-        Returns:
-        str
-            The name of the quantum gate.
-        """
-        return f"{self.name} Gate"
-
-class StandardGates:
-    """
-    A class to represent standard quantum gates.
-    """
-    @staticmethod
-    def I() -> QuantumGate:
-        return QuantumGate(np.array([[1, 0], [0, 1]], dtype=complex), 'I')
-
-    @staticmethod
-    def X() -> QuantumGate:
-        return QuantumGate(np.array([[0, 1], [1, 0]], dtype=complex), 'X')
-
-    @staticmethod
-    def Y() -> QuantumGate:
-        return QuantumGate(np.array([[0, -1j], [1j, 0]], dtype=complex), 'Y')
-
-    @staticmethod
-    def Z() -> QuantumGate:
-        return QuantumGate(np.array([[1, 0], [0, -1]], dtype=complex), 'Z')
-
-    @staticmethod
-    def H() -> QuantumGate:
-        return QuantumGate(np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2), 'H')
-
-    @staticmethod
-    def S() -> QuantumGate:
-        return QuantumGate(np.array([[1, 0], [0, 1j]], dtype=complex), 'S')
-
-    @staticmethod
-    def T() -> QuantumGate:
-        return QuantumGate(np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex), 'T')
-
-class ControlledGate:
-    """
-    A class to represent controlled quantum gates.
-    """
-    @staticmethod
-    def create_controlled(gate: QuantumGate) -> QuantumGate:
-        """
-        Creates a controlled version of a given quantum gate.
-
-        Parameters:
-        gate : QuantumGate
-            The quantum gate to be controlled.
-
-        Returns:
-        QuantumGate
-            The controlled quantum gate.
-        """
-        dim = len(gate.matrix)
-        controlled_matrix = np.eye(2 * dim, dtype=complex)
-        controlled_matrix[dim:, dim:] = gate.matrix
-        return QuantumGate(controlled_matrix, f"C-{gate.name}", gate.num_qubits + 1)
-
-    @staticmethod
-    def CNOT() -> QuantumGate:
-        return QuantumGate(np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex), "CNOT", 2)
-
-    @staticmethod
-    def SWAP() -> QuantumGate:
-        return QuantumGate(np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex), "SWAP", 2)
-
-class CustomGate(QuantumGate):
-    """
-    A class to represent a custom quantum gate created from a matrix.
-
-    Attributes:
-        matrix : np.ndarray
-            The matrix representation of the custom gate.
-        name : str
-            The name of the custom gate.
-        num_qubits : int
-            The number of qubits the gate acts on.
-    """
-    @classmethod
-    def from_matrix(cls, matrix: np.ndarray, name: str) -> 'CustomGate':
-        """
-        Creates an instance of CustomGate from a provided matrix.
-
-        Parameters:
-            matrix : np.ndarray
-                The matrix representation of the gate.
-            name : str
-                The name of the gate.
-
-        Returns:
-            CustomGate
-                An instance of CustomGate.
-
-        Raises:
-            ValueError
-                If the matrix dimensions are not 2^n x 2^n for some integer n.
-        """
-        num_qubits = int(np.log2(matrix.shape[0]))
-        if 2 ** num_qubits != matrix.shape[0]:
-            raise ValueError("Matrix dimensions must be 2^n x 2^n")
-        return cls(matrix, name, num_qubits)
+import cmath
+import math
+import os
+import numpy as np
+from typing import List, Optional, Union, Tuple
+from .qubit import Qubit, MultiQubitState
+
+# Precisão global dos estados e portas. complex64 corta pela metade os
+# bytes movidos em simulações memory-bound; exportar FEYNMS_DTYPE=complex64
+# ativa precisão simples para todo o pacote.
+DEFAULT_DTYPE = np.dtype(os.environ.get('FEYNMS_DTYPE', 'complex128'))
+
+# A checagem de unitariedade M @ M† ≈ I custa O(d³) por construção de porta;
+# exportar FEYNMS_VALIDATE=1 a reativa para depuração.
+_VALIDATE = os.environ.get('FEYNMS_VALIDATE', '0') == '1'
+
+class QuantumGate:
+    """
+    A class to represent a quantum gate.
+
+    Attributes:
+    matrix : np.ndarray
+        The matrix representation of the quantum gate.
+    name : str
+        The name of the quantum gate.
+    num_qubits : int
+        The number of qubits the gate acts on.
+    """
+    def __init__(self, matrix: np.ndarray, name: str, num_qubits: int = 1, validate: bool = True,
+                 dtype: Optional[np.dtype] = None):
+        """
+        Constructs all the necessary attributes for the QuantumGate object.
+
+        Parameters:
+        matrix : np.ndarray
+            The matrix representation of the quantum gate.
+        name : str
+            The name of the quantum gate.
+        num_qubits : int, optional
+            The number of qubits the gate acts on (default is 1).
+        validate : bool, optional
+            Whether to check the matrix shape and unitarity (default is
+            True). Internal callers with known-unitary matrices should use
+            `from_trusted` instead.
+        dtype : Optional[np.dtype], optional
+            The complex dtype of the matrix. Defaults to DEFAULT_DTYPE,
+            overridable globally via the FEYNMS_DTYPE environment variable.
+        """
+        self.matrix = np.array(matrix, dtype=dtype or DEFAULT_DTYPE)
+        self.name = name
+        self.num_qubits = num_qubits
+        self._tensor = None
+        if validate:
+            self._validate_matrix()
+
+    @classmethod
+    def from_trusted(cls, matrix: np.ndarray, name: str, num_qubits: int = 1,
+                     dtype: Optional[np.dtype] = None) -> 'QuantumGate':
+        """
+        Creates a gate from a matrix that is unitary by construction,
+        skipping the O(dim^3) unitarity check of the regular constructor.
+
+        Parameters:
+        matrix : np.ndarray
+            The matrix representation of the quantum gate.
+        name : str
+            The name of the quantum gate.
+        num_qubits : int, optional
+            The number of qubits the gate acts on (default is 1).
+        dtype : Optional[np.dtype], optional
+            The complex dtype of the matrix (default is DEFAULT_DTYPE).
+
+        Returns:
+        QuantumGate
+            The gate wrapping the given matrix, without revalidation.
+        """
+        gate = cls.__new__(cls)
+        gate.matrix = np.asarray(matrix, dtype=dtype or DEFAULT_DTYPE)
+        gate.name = name
+        gate.num_qubits = num_qubits
+        gate._tensor = None
+        return gate
+
+    def _validate_matrix(self):
+        dim = 2 ** self.num_qubits
+        if self.matrix.shape != (dim, dim):
+            raise ValueError(f"Matrix must have dimension {dim}x{dim}")
+        # A parte O(d³) só roda com FEYNMS_VALIDATE=1; a checagem de forma
+        # acima é barata e permanece incondicional
+        if _VALIDATE and not np.allclose(self.matrix @ self.matrix.conj().T, np.eye(dim)):
+            raise ValueError("Matrix must be unitary")
+
+    @property
+    def tensor(self) -> np.ndarray:
+        """The gate matrix reshaped to a rank-2k tensor, built once and cached."""
+        if self._tensor is None:
+            self._tensor = self.matrix.reshape([2] * (2 * self.num_qubits))
+        return self._tensor
+
+    def apply(self, state: Union[np.ndarray, 'MultiQubitState', List[Qubit]],
+              qubits: Optional[List[int]] = None) -> Union[np.ndarray, 'MultiQubitState']:
+        """
+        Applies the quantum gate to the given state.
+
+        The state is reshaped to a (2, ..., 2) tensor and only the target
+        axes are contracted with the gate tensor, so a k-qubit gate on an
+        n-qubit state costs O(2^n * 2^k) instead of an O(4^n) dense matmul.
+
+        Parameters:
+        state : Union[np.ndarray, MultiQubitState, List[Qubit]]
+            The global state vector (or a list of qubits, combined via
+            tensor product) the gate acts on.
+        qubits : Optional[List[int]], optional
+            Indices of the target qubits within the state. Defaults to the
+            first `num_qubits` qubits.
+
+        Returns:
+        Union[np.ndarray, MultiQubitState]
+            The resulting state after applying the gate, of the same kind
+            as the input (qubit lists produce a MultiQubitState).
+        """
+        qubit_names = None
+        if isinstance(state, list):
+            if len(state) != self.num_qubits:
+                raise ValueError(f"Gate {self.name} requires {self.num_qubits} qubits")
+            qubit_names = [q.name for q in state]
+            # Constrói o estado global com produto tensorial
+            state_vector = state[0].state
+            for q in state[1:]:
+                state_vector = np.kron(state_vector, q.state)
+        elif isinstance(state, MultiQubitState):
+            qubit_names = state.qubit_names
+            state_vector = state.state
+        else:
+            state_vector = np.asarray(state)
+
+        num_state_qubits = state_vector.size.bit_length() - 1
+        if qubits is None:
+            qubits = list(range(self.num_qubits))
+        if len(qubits) != self.num_qubits:
+            raise ValueError(f"Gate {self.name} requires {self.num_qubits} qubits")
+
+        # Contrai apenas os eixos alvo com o tensor da porta
+        state_tensor = state_vector.reshape([2] * num_state_qubits)
+        k = self.num_qubits
+        new_tensor = np.tensordot(self.tensor, state_tensor,
+                                  axes=(list(range(k, 2 * k)), qubits))
+        new_tensor = np.moveaxis(new_tensor, range(k), qubits)
+        # Porta unitária sobre estado normalizado preserva a norma até a
+        # precisão de máquina; renormalizar aqui seria custo puro
+        new_state = new_tensor.reshape(-1)
+
+        if qubit_names is not None:
+            return MultiQubitState(new_state, qubit_names)
+        return new_state
+
+    def __str__(self):
+        """
+        Returns a string representation of the quantum gate.
+
+        Returns:
+        str
+            The name of the quantum gate.
+        """
+        return f"{self.name} Gate"
+
+def _cached_gate(matrix: np.ndarray, name: str, num_qubits: int = 1) -> QuantumGate:
+    """
+    Builds a shared QuantumGate without re-running validation — the matrices
+    below are known unitaries. The matrix is frozen so the singleton cannot
+    be mutated by accident.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=DEFAULT_DTYPE)
+    matrix.flags.writeable = False
+    return QuantumGate.from_trusted(matrix, name, num_qubits)
+
+# Portas padrão pré-computadas uma única vez na importação do módulo;
+# escalares via math/cmath, sem despacho de ufunc do NumPy
+_INV_SQRT2 = 1 / math.sqrt(2)
+_T_PHASE = cmath.exp(1j * math.pi / 4)
+
+_I_GATE = _cached_gate(np.array([[1, 0], [0, 1]], dtype=complex), 'I')
+_X_GATE = _cached_gate(np.array([[0, 1], [1, 0]], dtype=complex), 'X')
+_Y_GATE = _cached_gate(np.array([[0, -1j], [1j, 0]], dtype=complex), 'Y')
+_Z_GATE = _cached_gate(np.array([[1, 0], [0, -1]], dtype=complex), 'Z')
+_H_GATE = _cached_gate(np.array([[_INV_SQRT2, _INV_SQRT2], [_INV_SQRT2, -_INV_SQRT2]], dtype=complex), 'H')
+_S_GATE = _cached_gate(np.array([[1, 0], [0, 1j]], dtype=complex), 'S')
+_T_GATE = _cached_gate(np.array([[1, 0], [0, _T_PHASE]], dtype=complex), 'T')
+_CNOT_GATE = _cached_gate(np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex), "CNOT", 2)
+_SWAP_GATE = _cached_gate(np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex), "SWAP", 2)
+
+class StandardGates:
+    """
+    A class to represent standard quantum gates.
+
+    Each method returns a shared, precomputed QuantumGate instance, so deep
+    circuits do not reallocate and revalidate the same matrices repeatedly.
+    """
+    @staticmethod
+    def I() -> QuantumGate:
+        return _I_GATE
+
+    @staticmethod
+    def X() -> QuantumGate:
+        return _X_GATE
+
+    @staticmethod
+    def Y() -> QuantumGate:
+        return _Y_GATE
+
+    @staticmethod
+    def Z() -> QuantumGate:
+        return _Z_GATE
+
+    @staticmethod
+    def H() -> QuantumGate:
+        return _H_GATE
+
+    @staticmethod
+    def S() -> QuantumGate:
+        return _S_GATE
+
+    @staticmethod
+    def T() -> QuantumGate:
+        return _T_GATE
+
+class ControlledOp(QuantumGate):
+    """
+    A class to represent a controlled gate stored as its target gate.
+
+    Only the target gate is kept; applying the controlled gate slices the
+    control axis of the state tensor and contracts the target gate with
+    the control=1 half only. This avoids allocating the 2dim x 2dim dense
+    controlled matrix (4*dim^2 entries of which only dim^2 are
+    nontrivial). The dense matrix is materialized lazily and only if
+    explicitly requested.
+
+    Attributes:
+    target_gate : QuantumGate
+        The gate applied when the control qubit is |1⟩.
+    name : str
+        The name of the controlled gate.
+    num_qubits : int
+        The number of qubits the gate acts on (control + targets).
+    """
+    def __init__(self, target_gate: QuantumGate):
+        """
+        Constructs all the necessary attributes for the ControlledOp object.
+
+        Parameters:
+        target_gate : QuantumGate
+            The gate applied when the control qubit is |1⟩.
+        """
+        self.target_gate = target_gate
+        self.name = f"C-{target_gate.name}"
+        self.num_qubits = target_gate.num_qubits + 1
+        self._tensor = None
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The dense matrix representation, built on demand."""
+        if self._matrix is None:
+            dim = 2 ** self.target_gate.num_qubits
+            controlled_matrix = np.eye(2 * dim, dtype=DEFAULT_DTYPE)
+            controlled_matrix[dim:, dim:] = self.target_gate.matrix
+            self._matrix = controlled_matrix
+        return self._matrix
+
+    def apply(self, state: Union[np.ndarray, 'MultiQubitState'],
+              qubits: Optional[List[int]] = None) -> Union[np.ndarray, 'MultiQubitState']:
+        """
+        Applies the controlled gate by updating only the control=1 slice.
+
+        Parameters:
+        state : Union[np.ndarray, MultiQubitState]
+            The global state vector the gate acts on.
+        qubits : Optional[List[int]], optional
+            Indices of the qubits within the state, control first.
+            Defaults to the first `num_qubits` qubits.
+
+        Returns:
+        Union[np.ndarray, MultiQubitState]
+            The resulting state after applying the gate.
+        """
+        qubit_names = None
+        if isinstance(state, MultiQubitState):
+            qubit_names = state.qubit_names
+            state_vector = state.state
+        else:
+            state_vector = np.asarray(state)
+
+        num_state_qubits = state_vector.size.bit_length() - 1
+        if qubits is None:
+            qubits = list(range(self.num_qubits))
+        if len(qubits) != self.num_qubits:
+            raise ValueError(f"Gate {self.name} requires {self.num_qubits} qubits")
+
+        control, targets = qubits[0], list(qubits[1:])
+        if np.issubdtype(state_vector.dtype, np.complexfloating):
+            new_state = state_vector.copy()
+        else:
+            new_state = np.array(state_vector, dtype=DEFAULT_DTYPE)
+        state_tensor = new_state.reshape([2] * num_state_qubits)
+
+        # Fatia onde o qubit de controle vale 1; o restante fica intacto
+        index = tuple(1 if axis == control else slice(None) for axis in range(num_state_qubits))
+        sub_tensor = state_tensor[index]
+        # Reindexa os alvos após a remoção do eixo de controle
+        sub_targets = [t - (t > control) for t in targets]
+
+        k = self.target_gate.num_qubits
+        new_sub = np.tensordot(self.target_gate.tensor, sub_tensor,
+                               axes=(list(range(k, 2 * k)), sub_targets))
+        state_tensor[index] = np.moveaxis(new_sub, range(k), sub_targets)
+
+        if qubit_names is not None:
+            return MultiQubitState(new_state, qubit_names)
+        return new_state
+
+class ControlledGate:
+    """
+    A class to represent controlled quantum gates.
+    """
+    @staticmethod
+    def create_controlled(gate: QuantumGate) -> QuantumGate:
+        """
+        Creates a controlled version of a given quantum gate.
+
+        Parameters:
+        gate : QuantumGate
+            The quantum gate to be controlled.
+
+        Returns:
+        QuantumGate
+            The controlled quantum gate, applied via the sparse
+            control-slice path (no dense controlled matrix is built).
+        """
+        return ControlledOp(gate)
+
+    @staticmethod
+    def CNOT() -> QuantumGate:
+        return _CNOT_GATE
+
+    @staticmethod
+    def SWAP() -> QuantumGate:
+        return _SWAP_GATE
+
+class DiagonalGate(QuantumGate):
+    """
+    A class to represent a gate whose matrix is diagonal.
+
+    Only the length-2^n diagonal is stored, so memory drops from O(4^n)
+    to O(2^n) and application is an elementwise product on the state
+    instead of a dense matmul. The dense matrix is materialized lazily
+    and only if explicitly requested.
+
+    Attributes:
+    diag : np.ndarray
+        The diagonal entries of the gate matrix.
+    name : str
+        The name of the quantum gate.
+    num_qubits : int
+        The number of qubits the gate acts on.
+    """
+    def __init__(self, diag: np.ndarray, name: str):
+        """
+        Constructs all the necessary attributes for the DiagonalGate object.
+
+        Parameters:
+        diag : np.ndarray
+            The diagonal entries of the gate matrix. Each entry must have
+            unit modulus for the gate to be unitary.
+        name : str
+            The name of the quantum gate.
+        """
+        self.diag = np.asarray(diag, dtype=DEFAULT_DTYPE)
+        self.name = name
+        self.num_qubits = self.diag.size.bit_length() - 1
+        if 2 ** self.num_qubits != self.diag.size:
+            raise ValueError("Diagonal length must be 2^n for some integer n")
+        self._tensor = None
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The dense matrix representation, built on demand."""
+        if self._matrix is None:
+            self._matrix = np.diag(self.diag)
+        return self._matrix
+
+    def apply(self, state: Union[np.ndarray, 'MultiQubitState'],
+              qubits: Optional[List[int]] = None) -> Union[np.ndarray, 'MultiQubitState']:
+        """
+        Applies the diagonal gate as an elementwise product on the state.
+
+        Parameters:
+        state : Union[np.ndarray, MultiQubitState]
+            The global state vector the gate acts on.
+        qubits : Optional[List[int]], optional
+            Indices of the target qubits within the state. Defaults to the
+            first `num_qubits` qubits.
+
+        Returns:
+        Union[np.ndarray, MultiQubitState]
+            The resulting state after applying the gate.
+        """
+        qubit_names = None
+        if isinstance(state, MultiQubitState):
+            qubit_names = state.qubit_names
+            state_vector = state.state
+        else:
+            state_vector = np.asarray(state)
+
+        num_state_qubits = state_vector.size.bit_length() - 1
+        if qubits is None:
+            qubits = list(range(self.num_qubits))
+        if len(qubits) != self.num_qubits:
+            raise ValueError(f"Gate {self.name} requires {self.num_qubits} qubits")
+
+        if qubits == list(range(num_state_qubits)):
+            # Porta cobre o registro inteiro: produto elementwise direto
+            new_state = state_vector * self.diag
+        else:
+            # Move os eixos alvo para frente e multiplica a diagonal em bloco
+            state_tensor = np.moveaxis(state_vector.reshape([2] * num_state_qubits),
+                                       qubits, range(self.num_qubits))
+            new_tensor = state_tensor.reshape(self.diag.size, -1) * self.diag[:, None]
+            new_tensor = np.moveaxis(new_tensor.reshape([2] * num_state_qubits),
+                                     range(self.num_qubits), qubits)
+            new_state = new_tensor.reshape(-1)
+
+        if qubit_names is not None:
+            return MultiQubitState(new_state, qubit_names)
+        return new_state
+
+class CustomGate(QuantumGate):
+    """
+    A class to represent a custom quantum gate created from a matrix.
+
+    Attributes:
+        matrix : np.ndarray
+            The matrix representation of the custom gate.
+        name : str
+            The name of the custom gate.
+        num_qubits : int
+            The number of qubits the gate acts on.
+    """
+    @classmethod
+    def from_matrix(cls, matrix: np.ndarray, name: str) -> 'CustomGate':
+        """
+        Creates an instance of CustomGate from a provided matrix.
+
+        Parameters:
+            matrix : np.ndarray
+                The matrix representation of the gate.
+            name : str
+                The name of the gate.
+
+        Returns:
+            CustomGate
+                An instance of CustomGate.
+
+        Raises:
+            ValueError
+                If the matrix dimensions are not 2^n x 2^n for some integer n.
+        """
+        # bit_length em vez de np.log2: operação inteira, sem arredondamento de float
+        num_qubits = matrix.shape[0].bit_length() - 1
+        if 2 ** num_qubits != matrix.shape[0]:
+            raise ValueError("Matrix dimensions must be 2^n x 2^n")
+        return cls(matrix, name, num_qubits)
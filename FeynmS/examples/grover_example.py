@@ -1,9 +1,9 @@
-from FeynmS.algorithms.grover import GroverSearch
-
-def main():
-    grover = GroverSearch(num_qubits=3, marked_states=["101"])
-    circuit = grover.run()
-    print(circuit.draw())
-
-if __name__ == "__main__":
+from FeynmS.algorithms.grover import GroverSearch
+
+def main():
+    grover = GroverSearch(num_qubits=3, marked_states=["101"])
+    circuit = grover.run()
+    print(circuit.draw())
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
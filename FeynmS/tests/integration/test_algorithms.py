@@ -1,7 +1,13 @@
-import pytest
-from FeynmS.algorithms.grover import GroverSearch
-
-def test_grover_search():
-    grover = GroverSearch(num_qubits=2, marked_states=["11"])
-    circuit = grover.run()
-    assert circuit.num_qubits == 2
\ No newline at end of file
+import pytest
+from FeynmS.algorithms.grover import GroverSearch
+
+def test_grover_search():
+    grover = GroverSearch(num_qubits=2, marked_states=["11"])
+    circuit = grover.run()
+    assert circuit.num_qubits == 2
+
+def test_grover_amplifies_marked_state():
+    grover = GroverSearch(num_qubits=3, marked_states=["101"])
+    counts = grover.run().execute(shots=1024)
+    assert sum(counts.values()) == 1024
+    assert max(counts, key=counts.get) == "101"
\ No newline at end of file
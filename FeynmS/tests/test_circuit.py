@@ -1,14 +1,31 @@
-import pytest
-from FeynmS.core.circuit import QuantumCircuit
-from FeynmS.core.gates import StandardGates
-
-def test_circuit_initialization():
-    circuit = QuantumCircuit(2)
-    assert circuit.num_qubits == 2
-    assert circuit.num_clbits == 2
-
-def test_circuit_h_gate():
-    circuit = QuantumCircuit(1)
-    circuit.h(0)
-    assert len(circuit.operations) == 1
-    assert circuit.operations[0].gate.name == "H"
\ No newline at end of file
+import pytest
+from FeynmS.core.circuit import QuantumCircuit
+from FeynmS.core.gates import StandardGates
+
+def test_circuit_initialization():
+    circuit = QuantumCircuit(2)
+    assert circuit.num_qubits == 2
+    assert circuit.num_clbits == 2
+
+def test_circuit_h_gate():
+    circuit = QuantumCircuit(1)
+    circuit.h(0)
+    assert len(circuit.operations) == 1
+    assert circuit.operations[0].gate.name == "H"
+
+def test_circuit_bell_pair_counts():
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure(0, 0)
+    circuit.measure(1, 1)
+    counts = circuit.execute(shots=1024)
+    assert set(counts) <= {"00", "11"}
+    assert sum(counts.values()) == 1024
+
+def test_circuit_optimize_fuses_single_qubit_gates():
+    circuit = QuantumCircuit(1)
+    circuit.h(0)
+    circuit.h(0)
+    circuit.optimize()
+    assert len(circuit.operations) == 1
\ No newline at end of file
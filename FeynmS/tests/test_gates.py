@@ -1,10 +1,19 @@
-import pytest
-import numpy as np
-from FeynmS.core.gates import QuantumGate, StandardGates
-
-def test_hadamard_gate():
-    h_gate = StandardGates.H()
-    qubit_state = np.array([1, 0], dtype=complex)
-    new_state = h_gate.apply(qubit_state)
-    expected_state = np.array([1, 1], dtype=complex) / np.sqrt(2)
-    assert np.allclose(new_state, expected_state)
\ No newline at end of file
+import pytest
+import numpy as np
+from FeynmS.core import gates
+from FeynmS.core.gates import QuantumGate, StandardGates
+
+def test_hadamard_gate():
+    h_gate = StandardGates.H()
+    qubit_state = np.array([1, 0], dtype=complex)
+    new_state = h_gate.apply(qubit_state)
+    expected_state = np.array([1, 1], dtype=complex) / np.sqrt(2)
+    assert np.allclose(new_state, expected_state)
+
+def test_unitarity_check_gated_by_validate_flag(monkeypatch):
+    non_unitary = np.array([[1, 2], [3, 4]], dtype=complex)
+    monkeypatch.setattr(gates, "_VALIDATE", True)
+    with pytest.raises(ValueError, match="unitary"):
+        QuantumGate(non_unitary, "bad")
+    monkeypatch.setattr(gates, "_VALIDATE", False)
+    QuantumGate(non_unitary, "bad")  # aceita sem a flag
\ No newline at end of file
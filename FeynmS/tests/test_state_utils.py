@@ -0,0 +1,26 @@
+import pytest
+import numpy as np
+from FeynmS.utils.state_utils import measure_state, measure_batched
+
+def test_measure_state_counts_sum_to_shots():
+    state = np.array([1, 1, 0, 0], dtype=complex) / np.sqrt(2)
+    counts = measure_state(state, shots=512)
+    assert sum(counts.values()) == 512
+    assert set(counts) <= {"00", "01"}
+
+def test_measure_batched_counts_per_row():
+    states = np.array([
+        [1, 0, 0, 0],
+        [0, 0, 0, 1],
+        [0.5, 0.5, 0.5, 0.5],
+    ], dtype=complex)
+    results = measure_batched(states, shots=256)
+    assert len(results) == 3
+    assert results[0] == {"00": 256}
+    assert results[1] == {"11": 256}
+    assert sum(results[2].values()) == 256
+
+def test_measure_batched_rejects_unnormalized():
+    states = np.array([[1, 1, 0, 0]], dtype=complex)
+    with pytest.raises(ValueError, match="normalized"):
+        measure_batched(states, shots=16)
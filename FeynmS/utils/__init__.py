@@ -1,2 +1,2 @@
-from .validation import check_normalization
-from .state_utils import state_to_vector, measure_state
\ No newline at end of file
+from .validation import check_normalization
+from .state_utils import state_to_vector, measure_state, measure_batched
\ No newline at end of file
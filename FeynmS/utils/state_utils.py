@@ -1,64 +1,141 @@
-import numpy as np
-from typing import List, Dict
-from .validation import check_normalization
-
-def state_to_vector(state: np.ndarray) -> List[complex]:
-    """
-    Converts a quantum state represented as a numpy array to a list of complex numbers.
-
-    Parameters:
-    state : np.ndarray
-        The quantum state to be converted.
-
-    Returns:
-    List[complex]
-        The quantum state as a list of complex numbers.
-    """
-    if not isinstance(state, np.ndarray):
-        raise ValueError("State must be a numpy array.")
-    if state.ndim > 2 or (state.ndim == 2 and min(state.shape) != 1):
-        raise ValueError("State must be a vector (unidimensional array or 2D with a dimensão equal to 1).")
-    
-    # Achata o array para garantir que seja unidimensional
-    state_vector = state.flatten()
-    
-    # Verifica se o tamanho é uma potência de 2 (opcional, apenas um aviso)
-    n = len(state_vector)
-    if n & (n - 1) != 0:
-        print("Alert: The length of the vector is not a power of 2, what is incommon for quantum states.")
-    
-    return state_vector.tolist()
-
-def measure_state(state: np.ndarray, shots: int = 1024) -> Dict[str, int]:
-    """
-    Measures a quantum state multiple times and returns the counts of each outcome.
-
-    Parameters:
-    state : np.ndarray
-        The quantum state to be measured.
-    shots : int, optional
-        The number of measurement shots (default is 1024).
-
-    Returns:
-    Dict[str, int]
-        A dictionary with the measurement outcomes as keys and their counts as values.
-    """
-    if not isinstance(state, np.ndarray):
-        raise ValueError("tate must be a numpy array.")
-
-    state_vector = state.flatten()
-    
-    # Verifica se o estado está normalizado
-    if not check_normalization(state_vector):
-        raise ValueError("State must be normalized (sum of the squared magnitudes must be 1).")
-    
-    probabilities = np.abs(state_vector) ** 2
-    results = np.random.choice(range(len(probabilities)), size=shots, p=probabilities)
-
-    counts = {}
-    num_qubits = int(np.log2(len(probabilities)))
-    for result in results:
-        key = bin(result)[2:].zfill(num_qubits)
-        counts[key] = counts.get(key, 0) + 1
-
-    return counts
\ No newline at end of file
+import numpy as np
+from typing import List, Dict
+from .validation import check_normalization
+
+try:
+    from numba import njit, prange, get_num_threads, get_thread_id
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(parallel=True)
+    def _sample_counts(cdf: np.ndarray, shots: int) -> np.ndarray:
+        """
+        Draws `shots` samples from the distribution with cumulative sums `cdf`
+        via binary search, accumulating into per-thread histograms that are
+        reduced at the end (avoids a race on the shared counts array).
+        """
+        n_bins = cdf.shape[0]
+        local_counts = np.zeros((get_num_threads(), n_bins), dtype=np.int64)
+        for i in prange(shots):
+            idx = np.searchsorted(cdf, np.random.random())
+            local_counts[get_thread_id(), idx] += 1
+        return local_counts.sum(axis=0)
+else:
+    def _sample_counts(cdf: np.ndarray, shots: int) -> np.ndarray:
+        """NumPy fallback used when numba is not installed."""
+        indices = np.searchsorted(cdf, _rng.random(shots))
+        return np.bincount(indices, minlength=cdf.shape[0])
+
+# Gerador próprio do módulo; evita re-semear o estado global legado do NumPy
+_rng = np.random.default_rng()
+
+def state_to_vector(state: np.ndarray) -> List[complex]:
+    """
+    Converts a quantum state represented as a numpy array to a list of complex numbers.
+
+    Parameters:
+    state : np.ndarray
+        The quantum state to be converted.
+
+    Returns:
+    List[complex]
+        The quantum state as a list of complex numbers.
+    """
+    if not isinstance(state, np.ndarray):
+        raise ValueError("State must be a numpy array.")
+    if state.ndim > 2 or (state.ndim == 2 and min(state.shape) != 1):
+        raise ValueError("State must be a vector (unidimensional array or 2D with a dimensão equal to 1).")
+    
+    # Achata o array para garantir que seja unidimensional
+    state_vector = state.flatten()
+    
+    # Verifica se o tamanho é uma potência de 2 (opcional, apenas um aviso)
+    n = len(state_vector)
+    if n & (n - 1) != 0:
+        print("Alert: The length of the vector is not a power of 2, what is incommon for quantum states.")
+    
+    return state_vector.tolist()
+
+def measure_state(state: np.ndarray, shots: int = 1024) -> Dict[str, int]:
+    """
+    Measures a quantum state multiple times and returns the counts of each outcome.
+
+    Parameters:
+    state : np.ndarray
+        The quantum state to be measured.
+    shots : int, optional
+        The number of measurement shots (default is 1024).
+
+    Returns:
+    Dict[str, int]
+        A dictionary with the measurement outcomes as keys and their counts as values.
+    """
+    if not isinstance(state, np.ndarray):
+        raise ValueError("tate must be a numpy array.")
+
+    state_vector = state.flatten()
+    
+    # Verifica se o estado está normalizado
+    if not check_normalization(state_vector):
+        raise ValueError("State must be normalized (sum of the squared magnitudes must be 1).")
+    
+    probabilities = np.abs(state_vector) ** 2
+    # bit_length em vez de np.log2: operação inteira, sem arredondamento de float
+    num_qubits = len(probabilities).bit_length() - 1
+
+    # Amostra via busca binária na CDF e acumula um histograma inteiro;
+    # só os bins não-nulos viram strings de bits no final
+    cdf = np.cumsum(probabilities)
+    cdf[-1] = 1.0  # evita que erros de arredondamento deixem amostras fora da CDF
+    bin_counts = _sample_counts(cdf, shots)
+
+    return {f'{idx:0{num_qubits}b}': int(bin_counts[idx])
+            for idx in np.flatnonzero(bin_counts)}
+
+def measure_batched(states: np.ndarray, shots: int = 1024) -> List[Dict[str, int]]:
+    """
+    Measures a batch of quantum states in a single vectorized pass.
+
+    All rows are sampled at once via broadcast cumulative-sum inversion,
+    so there is no per-state Python loop over the batch — useful for
+    workflows that sample many circuits (parameter sweeps, repeated
+    phase estimations).
+
+    Parameters:
+    states : np.ndarray
+        The quantum states to be measured, one per row, with shape
+        (batch, 2^n).
+    shots : int, optional
+        The number of measurement shots per state (default is 1024).
+
+    Returns:
+    List[Dict[str, int]]
+        One counts dictionary per state, in row order.
+    """
+    states = np.asarray(states)
+    if states.ndim != 2:
+        raise ValueError("States must be a 2D array of shape (batch, dim).")
+
+    probabilities = np.abs(states) ** 2
+    norms = probabilities.sum(axis=1)
+    if not np.allclose(norms, 1.0, atol=1e-10):
+        raise ValueError("All states must be normalized (sum of the squared magnitudes must be 1).")
+
+    batch, dim = probabilities.shape
+    num_qubits = dim.bit_length() - 1
+
+    # Inversão da CDF por broadcasting: uma única comparação vetorizada
+    # cobre todas as linhas e todos os shots
+    cdf = np.cumsum(probabilities, axis=1)
+    cdf[:, -1] = 1.0  # evita que erros de arredondamento deixem amostras fora da CDF
+    uniform = _rng.random((batch, shots))
+    indices = (uniform[:, :, None] > cdf[:, None, :]).sum(axis=-1)
+
+    # Um único bincount para o lote inteiro, com offset por linha
+    flat = (indices + np.arange(batch)[:, None] * dim).ravel()
+    bin_counts = np.bincount(flat, minlength=batch * dim).reshape(batch, dim)
+
+    return [{f'{idx:0{num_qubits}b}': int(row[idx]) for idx in np.flatnonzero(row)}
+            for row in bin_counts]
\ No newline at end of file
@@ -1,51 +1,88 @@
-import matplotlib.pyplot as plt
-from ..core.circuit import QuantumCircuit
-
-def plot_circuit(circuit: QuantumCircuit, save_path: str = None):
-    """
-    Plots the given quantum circuit using matplotlib.
-
-    Parameters:
-    circuit : QuantumCircuit
-        The quantum circuit to be plotted.
-    save_path : str, optional
-        If provided, saves the plot to the specified file path instead of displaying it.
-    """
-    if not circuit.operations or circuit.num_qubits == 0:
-        print("Warning: Empty circuit provided. Nothing to plot.")
-        return
-
-    # Configuração da figura
-    fig, ax = plt.subplots(figsize=(max(10, len(circuit.operations) * 1.5), circuit.num_qubits * 1.5))
-    ax.set_title("Quantum Circuit")
-    ax.set_xlabel("Operations")
-    ax.set_ylabel("Qubits")
-
-    # Desenha linhas horizontais para cada qubit
-    for i in range(circuit.num_qubits):
-        ax.axhline(y=i, color='black', linewidth=1)
-
-    # Desenha as operações do circuito
-    for idx, op in enumerate(circuit.operations):
-        if op.gate is not None:
-            for qubit in op.qubits:
-                ax.text(idx, qubit, op.gate.name, ha='center', va='center',
-                        bbox=dict(facecolor='white', edgecolor='black', boxstyle='round,pad=0.3'))
-
-    # Configura os eixos
-    ax.set_yticks(range(circuit.num_qubits))
-    ax.set_yticklabels([f"q{i}" for i in range(circuit.num_qubits)])
-    ax.set_xticks(range(len(circuit.operations)))
-    ax.set_xticklabels([f"Op {i}" for i in range(len(circuit.operations))])
-    ax.set_ylim(-0.5, circuit.num_qubits - 0.5)
-    ax.set_xlim(-0.5, len(circuit.operations) - 0.5)
-
-    # Ajusta o layout e exibe ou salva
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path)
-        print(f"Plot saved to {save_path}")
-    else:
-        plt.show()
-
-    plt.close(fig)  # Libera memória fechando a figura
\ No newline at end of file
+import matplotlib.pyplot as plt
+from matplotlib.patches import Rectangle
+from ..core.circuit import QuantumCircuit
+
+def plot_circuit(circuit: QuantumCircuit, save_path: str = None):
+    """
+    Plots the given quantum circuit using matplotlib.
+
+    Walks the circuit's operation arrays directly and draws each gate as
+    a rectangle patch on the qubit wires, with control qubits of
+    controlled gates rendered as dots and measurements as 'M' boxes. No
+    external circuit framework is involved, so importing and calling
+    this stays cheap.
+
+    Parameters:
+    circuit : QuantumCircuit
+        The quantum circuit to be plotted.
+    save_path : str, optional
+        If provided, saves the plot to the specified file path instead of displaying it.
+
+    Returns:
+    matplotlib.figure.Figure
+        The rendered figure, or None for an empty circuit.
+    """
+    num_ops = len(circuit._op_gates)
+    if num_ops == 0 or circuit.num_qubits == 0:
+        print("Warning: Empty circuit provided. Nothing to plot.")
+        return None
+
+    # Configuração da figura
+    fig, ax = plt.subplots(figsize=(max(10, num_ops * 1.5), circuit.num_qubits * 1.5))
+    ax.set_title("Quantum Circuit")
+    ax.set_xlabel("Operations")
+    ax.set_ylabel("Qubits")
+
+    # Desenha linhas horizontais para cada qubit
+    for i in range(circuit.num_qubits):
+        ax.axhline(y=i, color='black', linewidth=1, zorder=1)
+
+    # Desenha as operações do circuito como retângulos sobre os fios
+    box_w, box_h = 0.7, 0.6
+    for idx in range(num_ops):
+        gate = circuit._op_gates[idx]
+        qubits = circuit._op_qubits[idx]
+        label = 'M' if gate.name == "Measure" else gate.name
+
+        if gate.name.startswith("C-") and len(qubits) >= 2:
+            # Controle como ponto; caixa apenas nos qubits alvo
+            control, targets = qubits[0], qubits[1:]
+            ax.vlines(idx, min(qubits), max(qubits), color='black', linewidth=1, zorder=2)
+            ax.plot(idx, control, 'ko', markersize=8, zorder=3)
+            draw_qubits = targets
+            label = label[2:]
+        elif gate.name == "CNOT":
+            control, target = qubits
+            ax.vlines(idx, min(qubits), max(qubits), color='black', linewidth=1, zorder=2)
+            ax.plot(idx, control, 'ko', markersize=8, zorder=3)
+            draw_qubits = [target]
+            label = 'X'
+        else:
+            draw_qubits = qubits
+            if len(qubits) > 1:
+                ax.vlines(idx, min(qubits), max(qubits), color='black', linewidth=1, zorder=2)
+
+        for qubit in draw_qubits:
+            ax.add_patch(Rectangle((idx - box_w / 2, qubit - box_h / 2), box_w, box_h,
+                                   facecolor='white', edgecolor='black', zorder=3))
+            ax.text(idx, qubit, label, ha='center', va='center', zorder=4)
+
+    # Configura os eixos
+    ax.set_yticks(range(circuit.num_qubits))
+    ax.set_yticklabels([f"q{i}" for i in range(circuit.num_qubits)])
+    ax.set_xticks(range(num_ops))
+    ax.set_xticklabels([f"Op {i}" for i in range(num_ops)])
+    ax.set_ylim(-0.5, circuit.num_qubits - 0.5)
+    ax.set_xlim(-0.5, num_ops - 0.5)
+    ax.invert_yaxis()
+
+    # Ajusta o layout e exibe ou salva
+    plt.tight_layout()
+    if save_path:
+        plt.savefig(save_path)
+        print(f"Plot saved to {save_path}")
+    else:
+        plt.show()
+
+    plt.close(fig)  # Libera memória fechando a figura
+    return fig
@@ -13,8 +13,7 @@ setup(
     install_requires=[
         "numpy>=1.19",
         "scipy>=1.7",
-        "matplotlib>=3.4",
-        "qiskit>=0.34"
+        "matplotlib>=3.4"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",